@@ -2,17 +2,49 @@
 Chart and Data API Routes
 提供图表数据和分页数据查询的API端点
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+import base64
+import binascii
+import json
+from collections.abc import Mapping
+from decimal import Decimal
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, func
+from sqlalchemy import Float, String, Text, cast, desc, and_, or_, func, literal, null, select, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from datetime import datetime, timedelta
-from typing import List, Optional
-from database.connection import get_db
+from typing import List, Optional, Tuple, Union
+from database.connection import get_db, get_async_db
 from database.models import AIDecisionLog, Position, Order, Trade
+from services.response_cache import (
+    BALANCE_HISTORY_TTL,
+    PAGINATED_TTL,
+    cache_get,
+    cache_get_sync,
+    cache_set,
+    cache_set_sync,
+    make_cache_key,
+)
 from pydantic import BaseModel
 
 router = APIRouter()
 
+# 时间范围对应的回溯跨度（模块级常量，避免每次请求重新构造）
+TIME_RANGE_DELTAS = {
+    '24h': timedelta(hours=24),
+    '1w': timedelta(days=7),
+    '30d': timedelta(days=30),
+}
+TIME_RANGE_ALL_START = datetime(2000, 1, 1)  # 足够早的日期
+_ONE_MINUTE = timedelta(minutes=1)
+
+# 聚合周期对应的 date_trunc 单位（6m 不聚合）
+INTERVAL_TRUNC_UNITS = {
+    '1h': 'hour',
+    '1d': 'day',
+}
+
 
 # ==================== Response Models ====================
 
@@ -33,91 +65,199 @@ class BalanceHistoryResponse(BaseModel):
 
 class PaginatedResponse(BaseModel):
     items: List[dict]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 # ==================== Helper Functions ====================
 
+def quantized_now() -> datetime:
+    """
+    当前时间向上取整到下一分钟
+
+    同一分钟内的请求得到相同的查询边界（缓存键和查询参数一致），且不会漏掉最新记录
+    """
+    return datetime.now().replace(second=0, microsecond=0) + _ONE_MINUTE
+
+
 def get_time_range_filter(time_range: str, end_time: Optional[datetime] = None):
     """
     根据时间范围返回过滤条件
     """
-    now = end_time or datetime.now()
-    
-    if time_range == '24h':
-        start = now - timedelta(hours=24)
-    elif time_range == '1w':
-        start = now - timedelta(days=7)
-    elif time_range == '30d':
-        start = now - timedelta(days=30)
-    elif time_range == 'all':
-        start = datetime(2000, 1, 1)  # 足够早的日期
-    else:
+    if time_range == 'all':
+        return TIME_RANGE_ALL_START
+    if time_range not in TIME_RANGE_DELTAS:
         raise ValueError(f"Invalid time_range: {time_range}")
     
-    return start
+    return (end_time or quantized_now()) - TIME_RANGE_DELTAS[time_range]
+
+
+async def fast_count(db: AsyncSession, stmt) -> int:
+    """
+    统计查询结果总数
+
+    直接 SELECT count(*)，去掉 ORDER BY 和列投影，避免 Query.count() 的子查询包装
+    """
+    count_stmt = stmt.with_only_columns(
+        func.count(), maintain_column_froms=True
+    ).order_by(None)
+    return await db.scalar(count_stmt)
+
+
+def like_prefix(value: str) -> str:
+    """
+    构造前缀匹配的 LIKE 模式（转义通配符），可走 varchar_pattern_ops 索引
+    """
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def encode_cursor(values: tuple) -> str:
+    """
+    将最后一条记录的排序键编码为不透明的游标（base64 JSON）
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
 
 
-def aggregate_by_interval(data: List[AIDecisionLog], interval: str) -> List[BalanceHistoryPoint]:
+def decode_cursor(cursor: str, shape: Tuple[type, ...]) -> tuple:
     """
-    根据时间周期聚合数据
+    解码游标，按 shape 校验并返回排序键元组
+
+    shape 中 datetime 位置为 ISO 字符串或 null（排序时间列可为空），int 位置为整数 id；
+    格式不符时抛出 ValueError（返回 400）
     """
-    if not data:
-        return []
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(payload, list) or len(payload) != len(shape):
+        raise ValueError(f"Invalid cursor: {cursor}")
     
-    if interval == '6m':
-        # 6分钟：不聚合，直接返回
-        return [
-            BalanceHistoryPoint(
-                timestamp=d.decision_time.isoformat(),
-                total_balance=float(d.total_balance),
-                decision_id=d.id
-            )
-            for d in data
-        ]
-    elif interval == '1h':
-        # 1小时：取每小时的最后一个记录
-        grouped = {}
-        for d in data:
-            hour_key = d.decision_time.replace(minute=0, second=0, microsecond=0)
-            if hour_key not in grouped or d.decision_time > grouped[hour_key].decision_time:
-                grouped[hour_key] = d
-        
-        return [
-            BalanceHistoryPoint(
-                timestamp=d.decision_time.isoformat(),
-                total_balance=float(d.total_balance),
-                decision_id=d.id
-            )
-            for d in sorted(grouped.values(), key=lambda x: x.decision_time)
-        ]
-    elif interval == '1d':
-        # 1天：取每天的最后一个记录
-        grouped = {}
-        for d in data:
-            day_key = d.decision_time.date()
-            if day_key not in grouped or d.decision_time > grouped[day_key].decision_time:
-                grouped[day_key] = d
-        
-        return [
-            BalanceHistoryPoint(
-                timestamp=d.decision_time.isoformat(),
-                total_balance=float(d.total_balance),
-                decision_id=d.id
-            )
-            for d in sorted(grouped.values(), key=lambda x: x.decision_time)
-        ]
-    else:
-        raise ValueError(f"Invalid interval: {interval}")
+    values = []
+    for value, expected in zip(payload, shape):
+        if expected is datetime:
+            if value is None:
+                values.append(None)
+                continue
+            if not isinstance(value, str):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            values.append(datetime.fromisoformat(value))
+        elif expected is int:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            values.append(value)
+        else:
+            raise TypeError(f"Unsupported cursor field type: {expected}")
+    return tuple(values)
+
+
+def keyset_before(sort_col, id_col, cursor_value: Optional[datetime], cursor_id: int):
+    """
+    游标之后的行条件（排序为 sort_col DESC, id DESC）
+
+    PostgreSQL 倒序时 NULL 排在最前：游标落在 NULL 段时，继续取 NULL 段中更小的 id，再接非 NULL 的行
+    """
+    if cursor_value is None:
+        return or_(and_(sort_col.is_(None), id_col < cursor_id), sort_col.isnot(None))
+    return tuple_(sort_col, id_col) < tuple_(cursor_value, cursor_id)
+
+
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def render_json(content) -> bytes:
+    """
+    用 orjson 序列化响应（datetime 原生支持，Decimal 转 float，RowMapping 转 dict）
+    """
+    return orjson.dumps(content, default=_orjson_default)
+
+
+def json_response(body: Union[str, bytes]) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def trim_page(items: list, page_size: int, cursor_keys: Tuple[str, ...]) -> Tuple[list, bool, Optional[str]]:
+    """
+    截取按 page_size+1 查询的结果：多取的一行即可证明还有下一页，无需 COUNT
+
+    返回 (本页数据, has_more, next_cursor)，游标为本页最后一行的 cursor_keys 排序键
+    """
+    if len(items) <= page_size:
+        return items, False, None
+    items = items[:page_size]
+    return items, True, encode_cursor(tuple(items[-1][key] for key in cursor_keys))
+
+
+async def page_response(
+    cache_key: str,
+    items,
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    has_more: bool,
+    next_cursor: Optional[str],
+) -> Response:
+    """
+    组装分页响应体、写入缓存并返回
+
+    items 为行映射列表或 orjson.Fragment（SQL 生成的 JSON），直接交给 orjson 序列化，不逐行构建字典
+    """
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
+    body = render_json({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    })
+    await cache_set(cache_key, body, PAGINATED_TTL)
+    return json_response(body)
+
+
+def to_balance_points(rows: List[Tuple[int, datetime, Decimal]]) -> List[BalanceHistoryPoint]:
+    """
+    将查询结果 (id, decision_time, total_balance) 转换为图表数据点
+
+    1h / 1d 的分桶已在 SQL 中完成（DISTINCT ON date_trunc），每个桶只返回最后一条记录；
+    字段类型已由查询保证，用 model_construct 跳过逐行校验
+    """
+    return [
+        BalanceHistoryPoint.model_construct(
+            timestamp=d.decision_time.isoformat(),
+            total_balance=float(d.total_balance),
+            decision_id=d.id
+        )
+        for d in rows
+    ]
+
+
+def bucket_start(dt: datetime, interval: str) -> datetime:
+    """
+    返回 dt 所在聚合桶的起始时间（与 SQL date_trunc 一致）
+    """
+    if interval == '1h':
+        return dt.replace(minute=0, second=0, microsecond=0)
+    if interval == '1d':
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    return dt
 
 
 # ==================== API Endpoints ====================
 
 @router.get("/accounts/{account_id}/balance-history", response_model=BalanceHistoryResponse)
-async def get_balance_history(
+def get_balance_history(
     account_id: int,
     time_range: str = Query(..., description="Time range: 24h, 1w, 30d, all"),
     interval: str = Query(..., description="Interval: 6m, 1h, 1d"),
@@ -134,43 +274,70 @@ async def get_balance_history(
     - limit: 返回的数据点数量
     """
     try:
-        # 解析 end_time
-        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')) if end_time else datetime.now()
+        # 解析 end_time（未指定时取当前分钟边界，同一分钟内的请求共用缓存）
+        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')) if end_time else quantized_now()
+        
+        # 命中缓存直接返回
+        cache_key = make_cache_key("bh", account_id, time_range, interval, end_time or end_dt.isoformat(), limit)
+        cached = cache_get_sync(cache_key)
+        if cached:
+            return json_response(cached)
         
         # 获取时间范围
         start_dt = get_time_range_filter(time_range, end_dt)
         
-        # 查询数据（按时间倒序）
-        query = db.query(AIDecisionLog).filter(
+        if interval != '6m' and interval not in INTERVAL_TRUNC_UNITS:
+            raise ValueError(f"Invalid interval: {interval}")
+        
+        filters = (
             AIDecisionLog.account_id == account_id,
             AIDecisionLog.decision_time >= start_dt,
             AIDecisionLog.decision_time <= end_dt,
             AIDecisionLog.total_balance.isnot(None)
-        ).order_by(desc(AIDecisionLog.decision_time)).limit(limit + 1)  # +1 to check if has_more
+        )
+        
+        if interval in INTERVAL_TRUNC_UNITS:
+            # 1h / 1d：在数据库中按 date_trunc 分桶，每桶只取最后一条记录
+            bucket = func.date_trunc(INTERVAL_TRUNC_UNITS[interval], AIDecisionLog.decision_time)
+            latest_per_bucket = (
+                select(AIDecisionLog.id, AIDecisionLog.decision_time, AIDecisionLog.total_balance)
+                .distinct(bucket)
+                .where(*filters)
+                .order_by(bucket, desc(AIDecisionLog.decision_time))
+                .subquery()
+            )
+            stmt = select(latest_per_bucket).order_by(desc(latest_per_bucket.c.decision_time))
+        else:
+            # 6m：不聚合
+            stmt = select(
+                AIDecisionLog.id, AIDecisionLog.decision_time, AIDecisionLog.total_balance
+            ).where(*filters).order_by(desc(AIDecisionLog.decision_time))
         
-        results = query.all()
+        # 按时间倒序取最近的 limit+1 条（多取一条判断 has_more），外层再按时间正序返回（从旧到新）
+        latest = stmt.limit(limit + 1).subquery()
+        results = db.execute(select(latest).order_by(latest.c.decision_time)).all()
         
-        # 检查是否还有更多数据
+        # 检查是否还有更多数据（多出的一条是最早的那条）
         has_more = len(results) > limit
         if has_more:
-            results = results[:limit]
+            results = results[1:]
         
-        # 反转顺序（从旧到新）
-        results.reverse()
+        points = to_balance_points(results)
         
-        # 根据 interval 聚合数据
-        aggregated_data = aggregate_by_interval(results, interval)
-        
-        # 获取下一页的 end_time
+        # 获取下一页的 end_time：取最早一个点（聚合时为其所在桶的起点）之前 1µs，
+        # 查询条件 decision_time <= end_time 包含端点，这样下一页不会重复该点
         next_end_time = None
         if has_more and results:
-            next_end_time = results[0].decision_time.isoformat()
+            next_end_dt = bucket_start(results[0].decision_time, interval) - timedelta(microseconds=1)
+            next_end_time = next_end_dt.isoformat()
         
-        return BalanceHistoryResponse(
-            data=aggregated_data,
+        body = BalanceHistoryResponse.model_construct(
+            data=points,
             has_more=has_more,
             next_end_time=next_end_time
-        )
+        ).model_dump_json()
+        cache_set_sync(cache_key, body, BALANCE_HISTORY_TTL)
+        return json_response(body)
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -183,60 +350,66 @@ async def get_ai_decisions_paginated(
     account_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page (next_cursor)"),
+    include_total: bool = Query(False, description="Include total / total_pages (extra COUNT query)"),
     operation: Optional[str] = None,
     symbol: Optional[str] = None,
     executed: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     分页获取AI决策记录
+
+    - cursor: 传入上一页返回的 next_cursor 进行游标分页（推荐）；不传时按 page 偏移
     """
     try:
+        cache_key = make_cache_key(
+            "pg", account_id, "ai-decisions", page, page_size, cursor, include_total, operation, symbol, executed
+        )
+        cached = await cache_get(cache_key)
+        if cached:
+            return json_response(cached)
+        
         # 构建查询
-        query = db.query(AIDecisionLog).filter(AIDecisionLog.account_id == account_id)
+        stmt = select(
+            AIDecisionLog.id,
+            AIDecisionLog.account_id,
+            AIDecisionLog.decision_time,
+            AIDecisionLog.reason,
+            AIDecisionLog.operation,
+            AIDecisionLog.symbol,
+            # DECIMAL 列在 SQL 中转为 float，结果行无需逐个 float(Decimal)
+            cast(AIDecisionLog.prev_portion, Float).label("prev_portion"),
+            cast(AIDecisionLog.target_portion, Float).label("target_portion"),
+            cast(AIDecisionLog.total_balance, Float).label("total_balance"),
+            AIDecisionLog.executed,
+            AIDecisionLog.order_id,
+        ).where(AIDecisionLog.account_id == account_id)
         
         if operation:
-            query = query.filter(AIDecisionLog.operation == operation)
+            stmt = stmt.where(AIDecisionLog.operation == operation)
         if symbol:
-            query = query.filter(AIDecisionLog.symbol == symbol)
+            stmt = stmt.where(AIDecisionLog.symbol == symbol)
         if executed is not None:
-            query = query.filter(AIDecisionLog.executed == executed)
+            stmt = stmt.where(AIDecisionLog.executed == executed)
         
-        # 获取总数
-        total = query.count()
+        # 获取总数（按需）
+        total = await fast_count(db, stmt) if include_total else None
         
-        # 分页查询
-        offset = (page - 1) * page_size
-        items = query.order_by(desc(AIDecisionLog.decision_time)).offset(offset).limit(page_size).all()
+        # 分页查询（游标分页：按 (decision_time, id) 定位，不扫描已跳过的行）
+        stmt = stmt.order_by(desc(AIDecisionLog.decision_time), desc(AIDecisionLog.id))
+        if cursor:
+            cursor_time, cursor_id = decode_cursor(cursor, (datetime, int))
+            stmt = stmt.where(keyset_before(AIDecisionLog.decision_time, AIDecisionLog.id, cursor_time, cursor_id))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        items = (await db.execute(stmt.limit(page_size + 1))).mappings().all()
         
-        # 转换为字典
-        items_dict = [
-            {
-                "id": item.id,
-                "account_id": item.account_id,
-                "decision_time": item.decision_time.isoformat(),
-                "reason": item.reason or "",
-                "operation": item.operation or "",
-                "symbol": item.symbol,
-                "prev_portion": float(item.prev_portion) if item.prev_portion else 0.0,
-                "target_portion": float(item.target_portion) if item.target_portion else 0.0,
-                "total_balance": float(item.total_balance) if item.total_balance else 0.0,
-                "executed": item.executed,
-                "order_id": item.order_id
-            }
-            for item in items
-        ]
-        
-        total_pages = (total + page_size - 1) // page_size
-        
-        return PaginatedResponse(
-            items=items_dict,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+        items, has_more, next_cursor = trim_page(items, page_size, ("decision_time", "id"))
+        return await page_response(cache_key, items, total, page, page_size, has_more, next_cursor)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch AI decisions: {str(e)}")
 
@@ -246,44 +419,46 @@ async def get_positions_paginated(
     account_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from previous page (next_cursor)"),
+    include_total: bool = Query(False, description="Include total / total_pages (extra COUNT query)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     分页获取持仓记录
     """
     try:
-        query = db.query(Position).filter(Position.account_id == account_id)
+        cache_key = make_cache_key("pg", account_id, "positions", page, page_size, cursor, include_total)
+        cached = await cache_get(cache_key)
+        if cached:
+            return json_response(cached)
         
-        total = query.count()
-        offset = (page - 1) * page_size
-        items = query.order_by(desc(Position.id)).offset(offset).limit(page_size).all()
+        stmt = select(
+            Position.id,
+            Position.account_id,
+            Position.symbol,
+            Position.name,
+            Position.market,
+            cast(Position.quantity, Float).label("quantity"),
+            cast(Position.available_quantity, Float).label("available_quantity"),
+            cast(Position.avg_cost, Float).label("avg_cost"),
+            null().label("last_price"),  # 持仓表不保存行情价，保持响应结构
+            null().label("market_value"),
+        ).where(Position.account_id == account_id)
         
-        items_dict = [
-            {
-                "id": item.id,
-                "account_id": item.account_id,
-                "symbol": item.symbol,
-                "name": item.name,
-                "market": item.market,
-                "quantity": float(item.quantity),
-                "available_quantity": float(item.available_quantity),
-                "avg_cost": float(item.avg_cost),
-                "last_price": float(item.last_price) if item.last_price else None,
-                "market_value": float(item.market_value) if item.market_value else None
-            }
-            for item in items
-        ]
+        total = await fast_count(db, stmt) if include_total else None
+        stmt = stmt.order_by(desc(Position.id))
+        if cursor:
+            (cursor_id,) = decode_cursor(cursor, (int,))
+            stmt = stmt.where(Position.id < cursor_id)
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        items = (await db.execute(stmt.limit(page_size + 1))).mappings().all()
         
-        total_pages = (total + page_size - 1) // page_size
-        
-        return PaginatedResponse(
-            items=items_dict,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+        items, has_more, next_cursor = trim_page(items, page_size, ("id",))
+        return await page_response(cache_key, items, total, page, page_size, has_more, next_cursor)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch positions: {str(e)}")
 
@@ -293,53 +468,55 @@ async def get_orders_paginated(
     account_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page (next_cursor)"),
+    include_total: bool = Query(False, description="Include total / total_pages (extra COUNT query)"),
     status: Optional[str] = None,
     symbol: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     分页获取订单记录
     """
     try:
-        query = db.query(Order).filter(Order.account_id == account_id)
+        cache_key = make_cache_key("pg", account_id, "orders", page, page_size, cursor, include_total, status, symbol)
+        cached = await cache_get(cache_key)
+        if cached:
+            return json_response(cached)
+        
+        stmt = select(
+            Order.id,
+            Order.order_no,
+            Order.symbol,
+            Order.name,
+            Order.market,
+            Order.side,
+            Order.order_type,
+            cast(Order.price, Float).label("price"),
+            cast(Order.quantity, Float).label("quantity"),
+            cast(Order.filled_quantity, Float).label("filled_quantity"),
+            Order.status,
+            Order.created_at,
+        ).where(Order.account_id == account_id)
         
         if status:
-            query = query.filter(Order.status == status)
+            stmt = stmt.where(Order.status == status)
         if symbol:
-            query = query.filter(Order.symbol.like(f"%{symbol}%"))
+            stmt = stmt.where(Order.symbol.like(like_prefix(symbol)))
         
-        total = query.count()
-        offset = (page - 1) * page_size
-        items = query.order_by(desc(Order.created_at)).offset(offset).limit(page_size).all()
+        total = await fast_count(db, stmt) if include_total else None
+        stmt = stmt.order_by(desc(Order.created_at), desc(Order.id))
+        if cursor:
+            cursor_time, cursor_id = decode_cursor(cursor, (datetime, int))
+            stmt = stmt.where(keyset_before(Order.created_at, Order.id, cursor_time, cursor_id))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        items = (await db.execute(stmt.limit(page_size + 1))).mappings().all()
         
-        items_dict = [
-            {
-                "id": item.id,
-                "order_no": item.order_no,
-                "symbol": item.symbol,
-                "name": item.name,
-                "market": item.market,
-                "side": item.side,
-                "order_type": item.order_type,
-                "price": float(item.price) if item.price else None,
-                "quantity": float(item.quantity),
-                "filled_quantity": float(item.filled_quantity),
-                "status": item.status,
-                "created_at": item.created_at.isoformat()
-            }
-            for item in items
-        ]
-        
-        total_pages = (total + page_size - 1) // page_size
-        
-        return PaginatedResponse(
-            items=items_dict,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+        items, has_more, next_cursor = trim_page(items, page_size, ("created_at", "id"))
+        return await page_response(cache_key, items, total, page, page_size, has_more, next_cursor)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch orders: {str(e)}")
 
@@ -349,48 +526,71 @@ async def get_trades_paginated(
     account_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page (next_cursor)"),
+    include_total: bool = Query(False, description="Include total / total_pages (extra COUNT query)"),
     symbol: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     分页获取成交记录
     """
     try:
-        query = db.query(Trade).filter(Trade.account_id == account_id)
+        cache_key = make_cache_key("pg", account_id, "trades", page, page_size, cursor, include_total, symbol)
+        cached = await cache_get(cache_key)
+        if cached:
+            return json_response(cached)
         
-        if symbol:
-            query = query.filter(Trade.symbol.like(f"%{symbol}%"))
-        
-        total = query.count()
-        offset = (page - 1) * page_size
-        items = query.order_by(desc(Trade.trade_time)).offset(offset).limit(page_size).all()
+        stmt = select(
+            Trade.id,
+            Trade.order_id,
+            Trade.account_id,
+            Trade.symbol,
+            Trade.name,
+            Trade.market,
+            Trade.side,
+            cast(Trade.price, Float).label("price"),
+            cast(Trade.quantity, Float).label("quantity"),
+            cast(Trade.commission, Float).label("commission"),
+            Trade.trade_time,
+        ).where(Trade.account_id == account_id)
         
-        items_dict = [
-            {
-                "id": item.id,
-                "order_id": item.order_id,
-                "account_id": item.account_id,
-                "symbol": item.symbol,
-                "name": item.name,
-                "market": item.market,
-                "side": item.side,
-                "price": float(item.price),
-                "quantity": float(item.quantity),
-                "commission": float(item.commission),
-                "trade_time": item.trade_time.isoformat()
-            }
-            for item in items
-        ]
+        if symbol:
+            stmt = stmt.where(Trade.symbol.like(like_prefix(symbol)))
         
-        total_pages = (total + page_size - 1) // page_size
+        total = await fast_count(db, stmt) if include_total else None
+        stmt = stmt.order_by(desc(Trade.trade_time), desc(Trade.id))
+        if cursor:
+            cursor_time, cursor_id = decode_cursor(cursor, (datetime, int))
+            stmt = stmt.where(keyset_before(Trade.trade_time, Trade.id, cursor_time, cursor_id))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
         
-        return PaginatedResponse(
-            items=items_dict,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+        # 由 PostgreSQL 直接生成 items 的 JSON 文本（json_agg + json_build_object），不在 Python 中构建行对象；
+        # 同一条语句返回 has_more 和本页最后一行的排序键（用于 next_cursor）
+        page_rows = stmt.limit(page_size + 1).subquery()
+        numbered = select(
+            page_rows,
+            func.row_number().over(order_by=(desc(page_rows.c.trade_time), desc(page_rows.c.id))).label("rn"),
+        ).subquery()
+        in_page = numbered.c.rn <= page_size
+        last_row = numbered.c.rn == page_size
+        item = func.json_build_object(
+            *[arg for col in page_rows.c for arg in (literal(col.key, String), numbered.c[col.key])]
         )
+        items_json, has_more, last_time, last_id = (await db.execute(select(
+            cast(func.coalesce(
+                func.json_agg(aggregate_order_by(item, numbered.c.rn)).filter(in_page),
+                func.json_build_array(),
+            ), Text),
+            func.count() > page_size,
+            func.max(numbered.c.trade_time).filter(last_row),
+            func.max(numbered.c.id).filter(last_row),
+        ))).one()
+        
+        next_cursor = encode_cursor((last_time, last_id)) if has_more else None
+        return await page_response(cache_key, orjson.Fragment(items_json), total, page, page_size, has_more, next_cursor)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch trades: {str(e)}")
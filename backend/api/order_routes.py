@@ -13,6 +13,7 @@ from database.connection import SessionLocal
 from database.models import User, Order, Account
 from schemas.order import OrderCreate, OrderOut
 from services.order_matching import create_order, check_and_execute_order, get_pending_orders, cancel_order, process_all_pending_orders
+from services.response_cache import invalidate_account_cache
 from repositories.user_repo import verify_user_password, user_has_password, set_user_password, verify_auth_session
 
 logger = logging.getLogger(__name__)
@@ -126,6 +127,7 @@ async def create_new_order(request: OrderCreateRequest, db: Session = Depends(ge
         
         db.commit()
         db.refresh(order)
+        invalidate_account_cache(account.id)
         
         logger.info(f"User {user.username} created order: {order.order_no}")
         return order
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, ForeignKey, UniqueConstraint, Float, Date, DateTime
+from sqlalchemy import Column, Integer, String, DECIMAL, TIMESTAMP, ForeignKey, UniqueConstraint, Index, Float, Date, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import datetime
@@ -98,6 +98,9 @@ class Position(Base):
         TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
     )
 
+    # Keyset pagination: (account_id, id)
+    __table_args__ = (Index('idx_positions_account_id_id', 'account_id', 'id'),)
+
     account = relationship("Account", back_populates="positions")
 
 
@@ -122,6 +125,14 @@ class Order(Base):
         TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp()
     )
 
+    __table_args__ = (
+        # Keyset pagination: (account_id, created_at, id)
+        Index('idx_orders_account_created_id', 'account_id', 'created_at', 'id'),
+        # Symbol prefix filter (LIKE 'BTC%')
+        Index('idx_orders_account_symbol_prefix', 'account_id', 'symbol',
+              postgresql_ops={'symbol': 'varchar_pattern_ops'}),
+    )
+
     account = relationship("Account", back_populates="orders")
     trades = relationship("Trade", back_populates="order")
 
@@ -141,6 +152,14 @@ class Trade(Base):
     commission = Column(DECIMAL(18, 6), nullable=False, default=0)
     trade_time = Column(TIMESTAMP, server_default=func.current_timestamp())
 
+    __table_args__ = (
+        # Keyset pagination: (account_id, trade_time, id)
+        Index('idx_trades_account_time_id', 'account_id', 'trade_time', 'id'),
+        # Symbol prefix filter (LIKE 'BTC%')
+        Index('idx_trades_account_symbol_prefix', 'account_id', 'symbol',
+              postgresql_ops={'symbol': 'varchar_pattern_ops'}),
+    )
+
     order = relationship("Order", back_populates="trades")
 
 
@@ -233,6 +252,9 @@ class AIDecisionLog(Base):
     ai_response_json = Column(String, nullable=True)  # AI返回的完整交易决策数据（JSON格式）
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
 
+    # Keyset pagination: (account_id, decision_time, id)
+    __table_args__ = (Index('idx_ai_decision_logs_account_time_id', 'account_id', 'decision_time', 'id'),)
+
     # Relationships
     account = relationship("Account")
     order = relationship("Order")
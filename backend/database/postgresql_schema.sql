@@ -75,6 +75,7 @@ CREATE TABLE positions (
 
 CREATE INDEX idx_positions_account_id ON positions(account_id);
 CREATE INDEX idx_positions_symbol ON positions(symbol);
+CREATE INDEX idx_positions_account_id_id ON positions(account_id, id);
 
 -- 5. Orders Table
 CREATE TABLE orders (
@@ -100,6 +101,8 @@ CREATE INDEX idx_orders_order_no ON orders(order_no);
 CREATE INDEX idx_orders_symbol ON orders(symbol);
 CREATE INDEX idx_orders_status ON orders(status);
 CREATE INDEX idx_orders_created_at ON orders(created_at);
+CREATE INDEX idx_orders_account_created_id ON orders(account_id, created_at, id);
+CREATE INDEX idx_orders_account_symbol_prefix ON orders(account_id, symbol varchar_pattern_ops);
 
 -- 6. Trades Table
 CREATE TABLE trades (
@@ -120,6 +123,8 @@ CREATE INDEX idx_trades_account_id ON trades(account_id);
 CREATE INDEX idx_trades_order_id ON trades(order_id);
 CREATE INDEX idx_trades_symbol ON trades(symbol);
 CREATE INDEX idx_trades_trade_time ON trades(trade_time);
+CREATE INDEX idx_trades_account_time_id ON trades(account_id, trade_time, id);
+CREATE INDEX idx_trades_account_symbol_prefix ON trades(account_id, symbol varchar_pattern_ops);
 
 -- 7. Trading Configs Table
 CREATE TABLE trading_configs (
@@ -207,6 +212,7 @@ CREATE TABLE ai_decision_logs (
 
 CREATE INDEX idx_ai_decision_logs_account_id ON ai_decision_logs(account_id);
 CREATE INDEX idx_ai_decision_logs_decision_time ON ai_decision_logs(decision_time);
+CREATE INDEX idx_ai_decision_logs_account_time_id ON ai_decision_logs(account_id, decision_time, id);
 
 COMMENT ON COLUMN ai_decision_logs.ai_response_json IS 'AI返回的完整交易决策数据（JSON格式）';
 
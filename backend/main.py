@@ -1,14 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 import os
 
 from database.connection import engine, Base, SessionLocal
 from database.models import TradingConfig, User, Account, SystemConfig
 from config.settings import DEFAULT_TRADING_CONFIGS
-app = FastAPI(title="Crypto Paper Trading API")
+app = FastAPI(title="Crypto Paper Trading API", default_response_class=ORJSONResponse)
 
 # Health check endpoint
 @app.get("/api/health")
@@ -1,19 +1,23 @@
 """
 AI Decision Service - Handles AI model API calls for trading decisions
 """
+import asyncio
+import hashlib
 import logging
 import random
 import json
-import time
+import threading
 from decimal import Decimal
-from typing import Dict, Optional, List
+from typing import AsyncIterator, Dict, Optional, List
 
-import requests
+import httpx
+import orjson
 from sqlalchemy.orm import Session
 
 from database.models import Position, Account, AIDecisionLog
 from services.asset_calculator import calc_positions_value
 from services.news_feed import fetch_latest_news
+from services.response_cache import invalidate_account_cache
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,29 @@ DEMO_API_KEYS = {
     None
 }
 
+# Shared async HTTP client for AI API calls: keep-alive (HTTP/2) connections are
+# reused and multiplexed across decisions instead of a fresh TCP + TLS handshake
+# per request. Retries are handled by _chat_with_openai_stream (429-specific backoff).
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=30,
+    verify=False,  # Disable SSL verification for custom AI endpoints
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    headers={"Content-Type": "application/json"},
+)
+
+# Streamed completions: fail fast on connect, allow long generations
+STREAM_TIMEOUT = httpx.Timeout(120, connect=5)
+
+# The client's connection pool is bound to the event loop it runs on, so every
+# AI call runs on one background loop; sync callers (scheduler threads) wait on it.
+_ai_loop: Optional[asyncio.AbstractEventLoop] = None
+_ai_loop_lock = threading.Lock()
+
+# In-flight chat completions keyed by (endpoint, headers, payload); identical concurrent
+# requests share one upstream call. Only touched from the AI loop, so no lock.
+_inflight: Dict[str, "asyncio.Task"] = {}
+
 SUPPORTED_SYMBOLS: Dict[str, str] = {
     "BTC": "Bitcoin",
     "ETH": "Ethereum",
@@ -36,6 +63,158 @@ SUPPORTED_SYMBOLS: Dict[str, str] = {
 }
 
 
+def _get_ai_loop() -> asyncio.AbstractEventLoop:
+    """Get (or start) the background event loop that owns the AI HTTP client"""
+    global _ai_loop
+    with _ai_loop_lock:
+        if _ai_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="ai-http-loop", daemon=True).start()
+            _ai_loop = loop
+    return _ai_loop
+
+
+def _run_on_ai_loop(coro):
+    """Run a coroutine on the AI HTTP loop from sync code and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_ai_loop()).result()
+
+
+def _parse_completion_choice(text: str) -> Optional[Dict]:
+    """Get the first choice of a non-streaming completion body, logging why if there is none"""
+    try:
+        completion = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        logger.error(f"AI API returned a non-JSON response: {text[:500]}")
+        return None
+    if not isinstance(completion, dict):
+        logger.error(f"AI API returned an unexpected response: {text[:500]}")
+        return None
+    if completion.get("error"):
+        logger.error(f"AI API returned error: {completion['error']}")
+        return None
+    choices = completion.get("choices") or []
+    if not choices:
+        logger.error(f"AI API returned no choices: {text[:500]}")
+        return None
+    return choices[0]
+
+
+async def _chat_with_openai_stream(api_endpoint: str, headers: Dict[str, str], payload: Dict, max_retries: int = 3) -> AsyncIterator[Dict]:
+    """
+    Stream an OpenAI-compatible chat completion over SSE.
+    Yields each choice chunk ({"delta": {...}, "finish_reason": ...}) as it arrives.
+    Retries with exponential backoff on 429 and network errors before the first
+    chunk; yields nothing if the request ultimately failed. A non-SSE 200 response
+    (provider ignored "stream") is yielded as a single chunk carrying the message.
+    
+    Must be iterated on the AI loop (_run_on_ai_loop): _client's pooled connections
+    belong to it. Not usable directly from another event loop, e.g. a StreamingResponse.
+    """
+    # Serialize once; retries resend the same bytes
+    body = orjson.dumps({**payload, "stream": True})
+    for attempt in range(max_retries):
+        received = False
+        try:
+            async with _client.stream("POST", api_endpoint, headers=headers, content=body, timeout=STREAM_TIMEOUT) as response:
+                if response.status_code == 200:
+                    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                        # Provider / proxy ignored "stream": true and sent a regular completion
+                        await response.aread()
+                        choice = _parse_completion_choice(response.text)
+                        if choice is not None:
+                            yield {"delta": choice.get("message") or {}, "finish_reason": choice.get("finish_reason")}
+                        return
+                    
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data: "):
+                            continue
+                        data = line[6:].strip()
+                        if data == "[DONE]":
+                            break
+                        chunk = orjson.loads(data)
+                        if chunk.get("error"):
+                            logger.error(f"AI API stream returned error: {chunk['error']}")
+                            continue
+                        choices = chunk.get("choices") or []
+                        if choices:
+                            received = True
+                            yield choices[0]
+                    if not received:
+                        logger.error("AI API stream ended without any choices")
+                    return
+                
+                await response.aread()
+                if response.status_code == 429:
+                    # Rate limited, wait and retry
+                    wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff with jitter
+                    logger.warning(f"AI API rate limited (attempt {attempt + 1}/{max_retries}), waiting {wait_time:.1f}s...")
+                    if attempt < max_retries - 1:  # Don't wait on the last attempt
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        logger.error(f"AI API rate limited after {max_retries} attempts: {response.text}")
+                        return
+                else:
+                    logger.error(f"AI API returned status {response.status_code}: {response.text}")
+                    return
+        except httpx.RequestError as req_err:
+            if received:
+                raise  # Partial output already yielded, can't retry transparently
+            if attempt < max_retries - 1:
+                wait_time = (2 ** attempt) + random.uniform(0, 1)
+                logger.warning(f"AI API request failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s: {req_err}")
+                await asyncio.sleep(wait_time)
+                continue
+            else:
+                logger.error(f"AI API request failed after {max_retries} attempts: {req_err}")
+                return
+
+
+async def _chat_with_openai(api_endpoint: str, headers: Dict[str, str], payload: Dict, max_retries: int = 3) -> Optional[Dict]:
+    """
+    Run a streamed chat completion and assemble the chunks into a
+    non-streaming response body ({"choices": [{"message": ..., "finish_reason": ...}]}).
+    Concurrent calls with the same endpoint, headers (API key) and payload are
+    coalesced into one upstream request. Returns None if the request ultimately failed.
+    
+    Must run on the AI loop (_run_on_ai_loop), which owns _client and _inflight.
+    """
+    # Headers carry the API key: only calls billed to the same key may share a result
+    key = hashlib.sha256(
+        json.dumps([api_endpoint, headers, payload], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_chat_with_openai_once(api_endpoint, headers, payload, max_retries))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: one caller giving up must not cancel the request for the others
+    return await asyncio.shield(task)
+
+
+async def _chat_with_openai_once(api_endpoint: str, headers: Dict[str, str], payload: Dict, max_retries: int) -> Optional[Dict]:
+    """Single upstream streamed completion, assembled into a response body"""
+    content_parts: List[str] = []
+    reasoning_parts: List[str] = []
+    finish_reason = ""
+    received = False
+    async for choice in _chat_with_openai_stream(api_endpoint, headers, payload, max_retries):
+        received = True
+        delta = choice.get("delta") or {}
+        content_parts.append(delta.get("content") or "")
+        reasoning_parts.append(delta.get("reasoning") or "")
+        finish_reason = choice.get("finish_reason") or finish_reason
+    
+    if not received:
+        return None
+    return {
+        "choices": [{
+            "message": {"content": "".join(content_parts), "reasoning": "".join(reasoning_parts)},
+            "finish_reason": finish_reason
+        }]
+    }
+
+
 def _is_default_api_key(api_key: str) -> bool:
     """Check if the API key is a default/placeholder key that should be skipped"""
     return api_key in DEMO_API_KEYS
@@ -438,7 +617,6 @@ ADDITIONAL RULES:
 Remember: target_portion_of_balance for closing operations = portion of POSITION to close, NOT cash!"""
 
         headers = {
-            "Content-Type": "application/json",
             "Authorization": f"Bearer {account.api_key}"
         }
         
@@ -465,44 +643,9 @@ Remember: target_portion_of_balance for closing operations = portion of POSITION
         logger.info(f"Calling AI Model: {account.name} ({payload['model']})")
         logger.info(f"API Endpoint: {api_endpoint}")
         
-        # Retry logic for rate limiting
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    api_endpoint,
-                    headers=headers,
-                    json=payload,
-                    timeout=30,
-                    verify=False  # Disable SSL verification for custom AI endpoints
-                )
-                
-                if response.status_code == 200:
-                    break  # Success, exit retry loop
-                elif response.status_code == 429:
-                    # Rate limited, wait and retry
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff with jitter
-                    logger.warning(f"AI API rate limited (attempt {attempt + 1}/{max_retries}), waiting {wait_time:.1f}s...")
-                    if attempt < max_retries - 1:  # Don't wait on the last attempt
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"AI API rate limited after {max_retries} attempts: {response.text}")
-                        return None
-                else:
-                    logger.error(f"AI API returned status {response.status_code}: {response.text}")
-                    return None
-            except requests.RequestException as req_err:
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + random.uniform(0, 1)
-                    logger.warning(f"AI API request failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s: {req_err}")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"AI API request failed after {max_retries} attempts: {req_err}")
-                    return None
-        
-        result = response.json()
+        result = _run_on_ai_loop(_chat_with_openai(api_endpoint, headers, payload))
+        if result is None:
+            return None
         
         # Extract text from OpenAI-compatible response format
         if "choices" in result and len(result["choices"]) > 0:
@@ -596,7 +739,7 @@ Remember: target_portion_of_balance for closing operations = portion of POSITION
         logger.error(f"Unexpected AI response format: {result}")
         return None
         
-    except requests.RequestException as err:
+    except httpx.HTTPError as err:
         logger.error(f"AI API request failed: {err}")
         return None
     except json.JSONDecodeError as err:
@@ -665,6 +808,7 @@ def save_ai_decision(db: Session, account: Account, decision: Dict, portfolio: D
         
         db.add(decision_log)
         db.commit()
+        invalidate_account_cache(account.id)
         
         symbol_str = symbol if symbol else "N/A"
         logger.info(f"Saved AI decision log for account {account.name}: {operation} {symbol_str} "
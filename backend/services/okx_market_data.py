@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 import time
 from dotenv import load_dotenv
 from functools import lru_cache
+from types import SimpleNamespace
 from .mock_price_provider import get_mock_price, get_mock_kline_data, get_mock_symbols
 
 # 加载.env文件
@@ -670,21 +671,46 @@ class OKXClient:
 okx_client = OKXClient()
 
 
+@lru_cache(maxsize=16)
+def _get_account_client(name: str, okx_api_key: str, okx_secret: str, okx_passphrase: str, okx_sandbox: str) -> OKXClient:
+    """
+    Get (or create once) the OKX client for one set of account credentials
+
+    Creating a client builds two CCXT exchanges and loads their markets over the
+    network, so clients are reused across calls. The client keeps a plain copy of
+    the credentials rather than the (session-bound) Account instance.
+    """
+    credentials = SimpleNamespace(
+        name=name,
+        okx_api_key=okx_api_key,
+        okx_secret=okx_secret,
+        okx_passphrase=okx_passphrase,
+        okx_sandbox=okx_sandbox,
+    )
+    return OKXClient(account=credentials)
+
+
 def _get_client(account=None):
     """
     Get OKX client instance
     
     Args:
         account: Account model instance with OKX credentials (optional)
-                If provided, creates a new client with account config
+                If provided, returns the cached client for the account config
                 If not provided, uses global client with .env config
     
     Returns:
         OKXClient instance
     """
     if account and account.okx_api_key:
-        # Create account-specific client
-        return OKXClient(account=account)
+        # Account-specific client (one per credential set)
+        return _get_account_client(
+            account.name,
+            account.okx_api_key,
+            account.okx_secret,
+            account.okx_passphrase,
+            account.okx_sandbox,
+        )
     else:
         # Use global client (backward compatible)
         return okx_client
@@ -11,6 +11,7 @@ import logging
 
 from database.models import Order, Position, Trade, Account, User, CRYPTO_MIN_COMMISSION, CRYPTO_COMMISSION_RATE, CRYPTO_MIN_ORDER_QUANTITY, CRYPTO_LOT_SIZE
 from .market_data import get_last_price
+from .response_cache import invalidate_account_cache
 
 logger = logging.getLogger(__name__)
 
@@ -296,6 +297,7 @@ def _execute_order(db: Session, order: Order, account: Account, execution_price:
         order.status = "FILLED"
         
         db.commit()
+        invalidate_account_cache(account.id)
         
         logger.info(f"Order {order.order_no} executed: {order.side} {quantity} {order.symbol} @ ${execution_price}")
         return True
@@ -363,6 +365,7 @@ def cancel_order(db: Session, order: Order, reason: str = "User cancelled") -> b
         if account:
             _release_frozen_on_cancel(account, order)
         db.commit()
+        invalidate_account_cache(order.account_id)
         
         logger.info(f"Order {order.order_no} cancelled: {reason}")
         return True
@@ -0,0 +1,107 @@
+"""
+Redis response cache for chart and paginated read endpoints
+
+Enabled only when REDIS_URL is set; otherwise every lookup is a miss and
+the endpoints fall through to the database.
+"""
+
+import logging
+import os
+from typing import Optional, Union
+
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Format: redis://host:port/db
+REDIS_URL = os.getenv("REDIS_URL")
+
+BALANCE_HISTORY_TTL = 60  # seconds
+PAGINATED_TTL = 10  # seconds
+# Per-account index of cached keys lives as long as the longest-lived entry
+INDEX_TTL = max(BALANCE_HISTORY_TTL, PAGINATED_TTL)
+
+# Async client for async endpoints, sync client for threadpool endpoints and writers (scheduler threads)
+_async_client = aioredis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+_sync_client = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+
+
+def make_cache_key(prefix: str, account_id: int, *parts) -> str:
+    """Build a cache key; all keys of one account share the "{prefix}:{account_id}:" prefix"""
+    return ":".join([prefix, str(account_id)] + [str(p) for p in parts])
+
+
+def _index_key(account_id) -> str:
+    """Redis set holding every cached key of an account, so invalidation needs no SCAN"""
+    return f"keys:{account_id}"
+
+
+def _set_pipeline(pipe, key: str, value: Union[str, bytes], ttl_seconds: int):
+    """Queue the value write and its registration in the account's key index"""
+    index_key = _index_key(key.split(":", 2)[1])  # account id, see make_cache_key
+    pipe.set(key, value, ex=ttl_seconds)
+    pipe.sadd(index_key, key)
+    pipe.expire(index_key, INDEX_TTL)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get a cached response body, or None on miss / when Redis is unavailable"""
+    if _async_client is None:
+        return None
+    try:
+        return await _async_client.get(key)
+    except redis.RedisError as err:
+        logger.warning(f"Redis get failed for {key}: {err}")
+        return None
+
+
+async def cache_set(key: str, value: Union[str, bytes], ttl_seconds: int):
+    """Cache a response body with TTL"""
+    if _async_client is None:
+        return
+    try:
+        async with _async_client.pipeline(transaction=False) as pipe:
+            _set_pipeline(pipe, key, value, ttl_seconds)
+            await pipe.execute()
+    except redis.RedisError as err:
+        logger.warning(f"Redis set failed for {key}: {err}")
+
+
+def cache_get_sync(key: str) -> Optional[bytes]:
+    """Blocking cache_get for sync (threadpool) endpoints"""
+    if _sync_client is None:
+        return None
+    try:
+        return _sync_client.get(key)
+    except redis.RedisError as err:
+        logger.warning(f"Redis get failed for {key}: {err}")
+        return None
+
+
+def cache_set_sync(key: str, value: Union[str, bytes], ttl_seconds: int):
+    """Blocking cache_set for sync (threadpool) endpoints"""
+    if _sync_client is None:
+        return
+    try:
+        with _sync_client.pipeline(transaction=False) as pipe:
+            _set_pipeline(pipe, key, value, ttl_seconds)
+            pipe.execute()
+    except redis.RedisError as err:
+        logger.warning(f"Redis set failed for {key}: {err}")
+
+
+def invalidate_account_cache(account_id: int):
+    """Drop all cached chart / paginated responses of an account"""
+    if _sync_client is None:
+        return
+    index_key = _index_key(account_id)
+    try:
+        keys = _sync_client.smembers(index_key)
+        # Keys already expired by TTL are still listed; DEL ignores them
+        _sync_client.delete(index_key, *keys)
+    except redis.RedisError as err:
+        logger.warning(f"Redis invalidation failed for account {account_id}: {err}")
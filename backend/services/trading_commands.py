@@ -15,6 +15,7 @@ from database.models import Position, Account, Order, Trade
 from services.asset_calculator import calc_positions_value
 from services.market_data import get_last_price
 from services.okx_trading_executor import create_okx_order  # 使用OKX真实交易
+from services.response_cache import invalidate_account_cache
 from services.ai_decision_service import (
     call_ai_for_decision, 
     save_ai_decision, 
@@ -128,6 +129,7 @@ def _save_okx_order_to_db(
         )
         db.add(trade)
         db.commit()
+        invalidate_account_cache(account.id)
         
         logger.info(
             f"✅ Saved OKX order to database: order_id={order.id}, "
@@ -10,7 +10,7 @@ import {
   DialogHeader,
   DialogTitle,
 } from '@/components/ui/dialog'
-import { ChevronLeft, ChevronRight, ChevronsLeft, ChevronsRight, Eye } from 'lucide-react'
+import { ChevronLeft, ChevronRight, ChevronsLeft, Eye } from 'lucide-react'
 import {
   getAIDecisionsPaginated,
   getPositionsPaginated,
@@ -67,13 +67,21 @@ function AIDecisionsTable({ accountId }: { accountId: number }) {
   const [loading, setLoading] = useState(false)
   const [page, setPage] = useState(1)
   const [pageSize] = useState(20)
+  const [cursors, setCursors] = useState<Record<string, string>>({})
   const [selectedReason, setSelectedReason] = useState<string | null>(null)
 
   const loadData = async () => {
     try {
       setLoading(true)
-      const result = await getAIDecisionsPaginated(accountId, { page, page_size: pageSize })
+      const result = await getAIDecisionsPaginated(accountId, {
+        page,
+        page_size: pageSize,
+        cursor: cursors[`${accountId}:${page}`],
+      })
       setData(result)
+      if (result.next_cursor) {
+        setCursors(prev => ({ ...prev, [`${accountId}:${page + 1}`]: result.next_cursor! }))
+      }
     } catch (error) {
       console.error('Failed to load AI decisions:', error)
       toast.error('Failed to load AI decisions')
@@ -86,8 +94,6 @@ function AIDecisionsTable({ accountId }: { accountId: number }) {
     loadData()
   }, [accountId, page, pageSize])
 
-  const totalPages = data?.total_pages || 0
-
   return (
     <Card className="h-full flex flex-col">
       <div className="flex-1 min-h-0 overflow-auto p-2 md:p-4">
@@ -165,7 +171,7 @@ function AIDecisionsTable({ accountId }: { accountId: number }) {
       <div className="flex-shrink-0 border-t p-2 md:p-4">
         <PaginationControls
           page={page}
-          totalPages={totalPages}
+          hasMore={data?.has_more ?? false}
           onPageChange={setPage}
           loading={loading}
         />
@@ -186,12 +192,20 @@ function PositionsTable({ accountId }: { accountId: number }) {
   const [loading, setLoading] = useState(false)
   const [page, setPage] = useState(1)
   const [pageSize] = useState(20)
+  const [cursors, setCursors] = useState<Record<string, string>>({})
 
   const loadData = async () => {
     try {
       setLoading(true)
-      const result = await getPositionsPaginated(accountId, { page, page_size: pageSize })
+      const result = await getPositionsPaginated(accountId, {
+        page,
+        page_size: pageSize,
+        cursor: cursors[`${accountId}:${page}`],
+      })
       setData(result)
+      if (result.next_cursor) {
+        setCursors(prev => ({ ...prev, [`${accountId}:${page + 1}`]: result.next_cursor! }))
+      }
     } catch (error) {
       console.error('Failed to load positions:', error)
       toast.error('Failed to load positions')
@@ -204,8 +218,6 @@ function PositionsTable({ accountId }: { accountId: number }) {
     loadData()
   }, [accountId, page, pageSize])
 
-  const totalPages = data?.total_pages || 0
-
   return (
     <Card className="h-full flex flex-col">
       <div className="flex-1 min-h-0 overflow-auto p-2 md:p-4">
@@ -269,7 +281,7 @@ function PositionsTable({ accountId }: { accountId: number }) {
       <div className="flex-shrink-0 border-t p-2 md:p-4">
         <PaginationControls
           page={page}
-          totalPages={totalPages}
+          hasMore={data?.has_more ?? false}
           onPageChange={setPage}
           loading={loading}
         />
@@ -284,12 +296,20 @@ function OrdersTable({ accountId }: { accountId: number }) {
   const [loading, setLoading] = useState(false)
   const [page, setPage] = useState(1)
   const [pageSize] = useState(20)
+  const [cursors, setCursors] = useState<Record<string, string>>({})
 
   const loadData = async () => {
     try {
       setLoading(true)
-      const result = await getOrdersPaginated(accountId, { page, page_size: pageSize })
+      const result = await getOrdersPaginated(accountId, {
+        page,
+        page_size: pageSize,
+        cursor: cursors[`${accountId}:${page}`],
+      })
       setData(result)
+      if (result.next_cursor) {
+        setCursors(prev => ({ ...prev, [`${accountId}:${page + 1}`]: result.next_cursor! }))
+      }
     } catch (error) {
       console.error('Failed to load orders:', error)
       toast.error('Failed to load orders')
@@ -302,8 +322,6 @@ function OrdersTable({ accountId }: { accountId: number }) {
     loadData()
   }, [accountId, page, pageSize])
 
-  const totalPages = data?.total_pages || 0
-
   return (
     <Card className="h-full flex flex-col">
       <div className="flex-1 min-h-0 overflow-auto p-2 md:p-4">
@@ -375,7 +393,7 @@ function OrdersTable({ accountId }: { accountId: number }) {
       <div className="flex-shrink-0 border-t p-2 md:p-4">
         <PaginationControls
           page={page}
-          totalPages={totalPages}
+          hasMore={data?.has_more ?? false}
           onPageChange={setPage}
           loading={loading}
         />
@@ -390,12 +408,20 @@ function TradesTable({ accountId }: { accountId: number }) {
   const [loading, setLoading] = useState(false)
   const [page, setPage] = useState(1)
   const [pageSize] = useState(20)
+  const [cursors, setCursors] = useState<Record<string, string>>({})
 
   const loadData = async () => {
     try {
       setLoading(true)
-      const result = await getTradesPaginated(accountId, { page, page_size: pageSize })
+      const result = await getTradesPaginated(accountId, {
+        page,
+        page_size: pageSize,
+        cursor: cursors[`${accountId}:${page}`],
+      })
       setData(result)
+      if (result.next_cursor) {
+        setCursors(prev => ({ ...prev, [`${accountId}:${page + 1}`]: result.next_cursor! }))
+      }
     } catch (error) {
       console.error('Failed to load trades:', error)
       toast.error('Failed to load trades')
@@ -408,8 +434,6 @@ function TradesTable({ accountId }: { accountId: number }) {
     loadData()
   }, [accountId, page, pageSize])
 
-  const totalPages = data?.total_pages || 0
-
   return (
     <Card className="h-full flex flex-col">
       <div className="flex-1 min-h-0 overflow-auto p-2 md:p-4">
@@ -470,7 +494,7 @@ function TradesTable({ accountId }: { accountId: number }) {
       <div className="flex-shrink-0 border-t p-2 md:p-4">
         <PaginationControls
           page={page}
-          totalPages={totalPages}
+          hasMore={data?.has_more ?? false}
           onPageChange={setPage}
           loading={loading}
         />
@@ -482,19 +506,19 @@ function TradesTable({ accountId }: { accountId: number }) {
 // Reusable Pagination Controls
 function PaginationControls({
   page,
-  totalPages,
+  hasMore,
   onPageChange,
   loading
 }: {
   page: number
-  totalPages: number
+  hasMore: boolean
   onPageChange: (page: number) => void
   loading: boolean
 }) {
   return (
     <div className="flex flex-col md:flex-row items-center justify-between gap-2">
       <div className="text-xs md:text-sm text-gray-500">
-        Page {page} of {totalPages || 1}
+        Page {page}
       </div>
       <div className="flex gap-1 md:gap-2">
         <Button
@@ -519,20 +543,11 @@ function PaginationControls({
           variant="outline"
           size="sm"
           onClick={() => onPageChange(page + 1)}
-          disabled={page >= totalPages || loading}
+          disabled={!hasMore || loading}
           className="h-8 w-8 md:h-9 md:w-9 p-0"
         >
           <ChevronRight className="h-3 w-3 md:h-4 md:w-4" />
         </Button>
-        <Button
-          variant="outline"
-          size="sm"
-          onClick={() => onPageChange(totalPages)}
-          disabled={page >= totalPages || loading}
-          className="h-8 w-8 md:h-9 md:w-9 p-0"
-        >
-          <ChevronsRight className="h-3 w-3 md:h-4 md:w-4" />
-        </Button>
       </div>
     </div>
   )
@@ -163,14 +163,18 @@ export async function getBalanceHistory(params: BalanceHistoryParams): Promise<{
 export interface PaginationParams {
   page: number
   page_size: number
+  cursor?: string  // 上一页返回的 next_cursor，用于游标分页
+  include_total?: boolean  // 是否返回 total / total_pages（额外的 COUNT 查询）
 }
 
 export interface PaginatedResponse<T> {
   items: T[]
-  total: number
+  total?: number
   page: number
   page_size: number
-  total_pages: number
+  total_pages?: number
+  next_cursor?: string
+  has_more: boolean
 }
 
 export async function getAIDecisionsPaginated(
@@ -182,6 +186,8 @@ export async function getAIDecisionsPaginated(
     page: pagination.page.toString(),
     page_size: pagination.page_size.toString(),
   })
+  if (pagination.cursor) params.append('cursor', pagination.cursor)
+  if (pagination.include_total) params.append('include_total', 'true')
   
   if (filters?.operation) params.append('operation', filters.operation)
   if (filters?.symbol) params.append('symbol', filters.symbol)
@@ -214,6 +220,8 @@ export async function getPositionsPaginated(
     page: pagination.page.toString(),
     page_size: pagination.page_size.toString(),
   })
+  if (pagination.cursor) params.append('cursor', pagination.cursor)
+  if (pagination.include_total) params.append('include_total', 'true')
   
   const response = await apiRequest(`/accounts/${accountId}/positions/paginated?${params.toString()}`)
   return response.json()
@@ -243,6 +251,8 @@ export async function getOrdersPaginated(
     page: pagination.page.toString(),
     page_size: pagination.page_size.toString(),
   })
+  if (pagination.cursor) params.append('cursor', pagination.cursor)
+  if (pagination.include_total) params.append('include_total', 'true')
   
   if (filters?.status) params.append('status', filters.status)
   if (filters?.symbol) params.append('symbol', filters.symbol)
@@ -274,6 +284,8 @@ export async function getTradesPaginated(
     page: pagination.page.toString(),
     page_size: pagination.page_size.toString(),
   })
+  if (pagination.cursor) params.append('cursor', pagination.cursor)
+  if (pagination.include_total) params.append('include_total', 'true')
   
   if (filters?.symbol) params.append('symbol', filters.symbol)
   